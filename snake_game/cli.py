@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import bisect
 import curses
+import functools
 import locale
 import os
 import random
+import signal
 import sys
 import time
 from typing import Dict, List, Tuple
@@ -28,6 +31,8 @@ NPC_PLAYERS = [
 ]
 GITHUB_ICON = "\uea84"
 MEDALS = ["🥇", "🥈", "🥉"]
+# 排行榜每行的固定前缀（奖牌或占位符），避免每帧重新解析格式串
+_LB_PREFIXES = tuple((MEDALS[idx] if idx < 3 else " ") + " " for idx in range(10))
 
 KEYS: Dict[int, tuple[int, int]] = {
     curses.KEY_UP: UP,
@@ -37,6 +42,43 @@ KEYS: Dict[int, tuple[int, int]] = {
 }
 
 
+# 终端尺寸只在收到 SIGWINCH 后重新查询，避免每帧一次 ioctl
+_RESIZE_PENDING = True
+
+# 已知支持 DECSET 2026 同步输出（或安全忽略它）的终端
+_SYNC_TERMS = ("xterm", "tmux", "screen", "kitty", "alacritty", "wezterm", "ghostty", "foot")
+
+
+@functools.lru_cache(maxsize=1)
+def _sync_output_supported() -> bool:
+    term = os.environ.get("TERM", "")
+    return any(name in term for name in _SYNC_TERMS)
+
+
+def _synced_doupdate() -> None:
+    """Push the pending frame, wrapped in a synchronized-output block.
+
+    Terminals that understand DECSET 2026 defer presentation until the
+    closing sequence, so a partially transmitted frame never shows
+    (no tearing over SSH/tmux); others ignore the private mode.
+    """
+    if not _sync_output_supported():
+        curses.doupdate()
+        return
+    sys.stdout.write("\x1b[?2026h")
+    sys.stdout.flush()
+    try:
+        curses.doupdate()
+    finally:
+        sys.stdout.write("\x1b[?2026l")
+        sys.stdout.flush()
+
+
+def _note_resize(_signum, _frame) -> None:
+    global _RESIZE_PENDING
+    _RESIZE_PENDING = True
+
+
 def _safe_addch(stdscr: curses.window, y: int, x: int, ch: str) -> None:
     try:
         stdscr.addch(y, x, ch)
@@ -51,29 +93,84 @@ def _safe_addstr(stdscr: curses.window, y: int, x: int, text: str, attr: int = 0
         pass
 
 
+def _display_width(text: str) -> int:
+    # 逐字符估算终端列宽：ASCII 一列，其余按两列（宁可高估）
+    return sum(1 if ch.isascii() else 2 for ch in text)
+
+
+def build_palette(color_enabled: bool) -> Dict[str, int]:
+    """Pack every (color_pair | attribute) combination once at startup."""
+    if color_enabled:
+        return {
+            "title": curses.color_pair(6) | curses.A_BOLD,
+            "score": curses.color_pair(5),
+            "player": curses.color_pair(1) | curses.A_BOLD,
+            "heart": curses.color_pair(3) | curses.A_BOLD,
+            "wall": curses.color_pair(5),
+            "text": curses.color_pair(5),
+            "food": curses.color_pair(3) | curses.A_BOLD,
+            "head": curses.color_pair(1) | curses.A_BOLD,
+            "body": curses.color_pair(2),
+            "banner": curses.color_pair(2) | curses.A_BOLD,
+        }
+    return {
+        "title": curses.A_BOLD,
+        "score": 0,
+        "player": curses.A_BOLD,
+        "heart": 0,
+        "wall": 0,
+        "text": 0,
+        "food": 0,
+        "head": 0,
+        "body": 0,
+        "banner": curses.A_BOLD,
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def get_wall_glyph() -> str:
+    # 编码在进程内不会变化，缓存结果即可
     encoding = (sys.stdout.encoding or locale.getpreferredencoding(False) or "").lower()
     return WALL_GLYPH if "utf" in encoding else "###"
 
 
-def _draw_wall_cell(stdscr: curses.window, y: int, x: int, glyph: str, attr: int = 0) -> None:
-    if glyph == "###":
-        try:
-            stdscr.addstr(y, x, "###", attr)
-        except curses.error:
-            pass
-        return
-    try:
-        stdscr.addstr(y, x, glyph, attr)
-    except curses.error:
-        try:
-            stdscr.addstr(y, x, "###", attr)
-        except curses.error:
-            pass
+_WALL_ROW_CACHE: Dict[Tuple[int, str], Tuple[str, str]] = {}
+
+
+def _wall_rows(board_width: int, glyph: str) -> Tuple[str, str]:
+    """Return (top/bottom row, side row) strings for a board, composed once.
+
+    The walls never change between resizes, so we build each full row as a
+    single string and emit it with one ``addstr`` instead of one call per cell.
+    """
+    cached = _WALL_ROW_CACHE.get((board_width, glyph))
+    if cached is not None:
+        return cached
+    cells = range(0, board_width, CELL_WIDTH)
+    top_bottom = (glyph.ljust(CELL_WIDTH) * len(cells)).rstrip()
+    right_x = board_width - CELL_WIDTH
+    side = glyph + " " * (right_x - len(glyph)) + glyph
+    rows = (top_bottom, side)
+    _WALL_ROW_CACHE[(board_width, glyph)] = rows
+    return rows
+
+
+def _roll_npc_scores() -> List[Tuple[str, str, int]]:
+    # 为每个NPC生成20-30之间的随机分数，按分数降序排好
+    scores = [(icon, name, random.randint(20, 30)) for icon, name in NPC_PLAYERS]
+    scores.sort(key=lambda entry: entry[2], reverse=True)
+    return scores
+
+
+_MIN_DELAY = 0.01
+# 30分后延迟到达下限，表只需覆盖到那里
+_SPEED_TABLE = tuple(max(_MIN_DELAY, 0.16 - s * 0.005) for s in range(31))
 
 
 def speed_delay(score: int) -> float:
-    return max(0.01, 0.16 - score * 0.005)
+    if 0 <= score < len(_SPEED_TABLE):
+        return _SPEED_TABLE[score]
+    return _MIN_DELAY
 
 
 def compute_board_size(term_rows: int, term_cols: int) -> int:
@@ -83,42 +180,47 @@ def compute_board_size(term_rows: int, term_cols: int) -> int:
     return max(MIN_BOARD_SIZE, size)
 
 
-def draw_leaderboard(stdscr: curses.window, npc_scores: List[Tuple[str, str, int]], player_score: int, offset_y: int, color_enabled: bool) -> None:
-    title_attr = (curses.color_pair(6) | curses.A_BOLD) if color_enabled else curses.A_BOLD
-    score_attr = curses.color_pair(5) if color_enabled else 0
-    player_attr = (curses.color_pair(1) | curses.A_BOLD) if color_enabled else curses.A_BOLD
-    
-    _safe_addstr(stdscr, offset_y, 2, "🏆 TOP SCORES", title_attr)
-    
-    # 合并GitHub玩家和NPC分数
-    all_scores = [(GITHUB_ICON, "GitHub", player_score)] + npc_scores
-    all_scores.sort(key=lambda x: x[2], reverse=True)
-    
+def draw_leaderboard(renderer: "Renderer", npc_scores: List[Tuple[str, str, int]], player_score: int, offset_y: int, palette: Dict[str, int], clip_x: int) -> None:
+    score_attr = palette["score"]
+    player_attr = palette["player"]
+
+    # 碰到棋盘左墙（clip_x 列）的行直接不画：差量刷新假定单元格互不重叠，
+    # 排行榜压进棋盘会在分数变化时盖掉墙而墙自身的键又不会重绘
+    title = "🏆 TOP SCORES"
+    if 2 + _display_width(title) <= clip_x:
+        renderer.emit(offset_y, 2, title, palette["title"])
+
+    # npc_scores 已按分数降序排列，用二分查找插入玩家行即可
+    player_idx = bisect.bisect_left(npc_scores, -player_score, key=lambda entry: -entry[2])
+    all_scores = list(npc_scores)
+    all_scores.insert(player_idx, (GITHUB_ICON, "GitHub", player_score))
+
     for idx, (icon, name, score) in enumerate(all_scores[:10]):
-        medal = MEDALS[idx] if idx < 3 else " "
         is_player = (name == "GitHub")
         attr = player_attr if is_player else score_attr
-        line = f"{medal} {icon} {score:3d}"
-        _safe_addstr(stdscr, offset_y + 2 + idx, 2, line, attr)
+        line = _LB_PREFIXES[idx] + icon + " " + str(score).rjust(3)
+        if 2 + _display_width(line) <= clip_x:
+            renderer.emit(offset_y + 2 + idx, 2, line, attr)
 
 
-def draw_lives(stdscr: curses.window, lives: int, max_x: int, max_y: int, offset_y: int, color_enabled: bool) -> None:
+def draw_lives(renderer: "Renderer", lives: int, max_x: int, max_y: int, offset_y: int, palette: Dict[str, int], clip_x: int) -> None:
     heart = "❤️"
-    heart_attr = (curses.color_pair(3) | curses.A_BOLD) if color_enabled else 0
+    heart_attr = palette["heart"]
     start_x = max_x - 4
-    if start_x < 0:
+    # 同排行榜：不能挤进棋盘右墙以内
+    if start_x < clip_x:
         return
     for heart_idx in range(max(0, lives)):
         y_pos = offset_y + 1 + heart_idx * 2
         if y_pos < max_y:
-            _safe_addstr(stdscr, y_pos, start_x, heart, heart_attr)
+            renderer.emit(y_pos, start_x, heart, heart_attr)
 
 
-def draw_start_screen(stdscr: curses.window, color_enabled: bool) -> None:
+def draw_start_screen(stdscr: curses.window, palette: Dict[str, int]) -> None:
     stdscr.erase()
     max_y, max_x = stdscr.getmaxyx()
-    title_attr = (curses.color_pair(1) | curses.A_BOLD) if color_enabled else curses.A_BOLD
-    text_attr = curses.color_pair(5) if color_enabled else 0
+    title_attr = palette["player"]
+    text_attr = palette["text"]
     title = "PIXEL SNAKE"
     subtitle = "Press SPACE to start"
     controls = "Arrow Keys: Move   P:Pause   R:Restart   Q:Quit"
@@ -137,7 +239,7 @@ def draw_start_screen(stdscr: curses.window, color_enabled: bool) -> None:
         controls,
         text_attr,
     )
-    stdscr.refresh()
+    stdscr.noutrefresh()
 
 
 def create_state_for_terminal(stdscr: curses.window) -> GameState:
@@ -146,94 +248,210 @@ def create_state_for_terminal(stdscr: curses.window) -> GameState:
     return create_initial_state(width=board_size, height=board_size)
 
 
-def draw_game_over_banner(
-    stdscr: curses.window, max_y: int, max_x: int, color_enabled: bool
-) -> None:
+@functools.lru_cache(maxsize=1)
+def _game_over_banner_lines() -> Tuple[str, ...]:
     if pyfiglet is not None:
-        banner = [
+        return tuple(
             line
             for line in pyfiglet.figlet_format("GAME OVER", font="big").splitlines()
             if line.strip()
-        ]
-    else:
-        banner = [
-            " ####   ###  #   # ####    ###  #   # ##### #### ",
-            "#      #   # ## ## #      #   # #   # #     #   #",
-            "# ###  ##### # # # ###    #   # #   # ###   #### ",
-            "#   #  #   # #   # #      #   #  # #  #     #  # ",
-            " ####  #   # #   # ####    ###    #   ##### #   #",
-        ]
-    attr = (curses.color_pair(2) | curses.A_BOLD) if color_enabled else curses.A_BOLD
+        )
+    return (
+        " ####   ###  #   # ####    ###  #   # ##### #### ",
+        "#      #   # ## ## #      #   # #   # #     #   #",
+        "# ###  ##### # # # ###    #   # #   # ###   #### ",
+        "#   #  #   # #   # #      #   #  # #  #     #  # ",
+        " ####  #   # #   # ####    ###    #   ##### #   #",
+    )
+
+
+def draw_game_over_banner(
+    renderer: "Renderer", max_y: int, max_x: int, palette: Dict[str, int]
+) -> None:
+    banner = _game_over_banner_lines()
+    attr = palette["banner"]
     start_row = max(0, (max_y - len(banner)) // 2)
     for idx, line in enumerate(banner):
         x = max(0, (max_x - len(line)) // 2)
-        _safe_addstr(stdscr, start_row + idx, x, line, attr)
-
-
-def draw(stdscr: curses.window, state: GameState, paused: bool, color_enabled: bool, npc_scores: List[Tuple[str, str, int]]) -> bool:
-    stdscr.erase()
-    board_width = state.width * CELL_WIDTH + 2
-    board_height = state.height + 2
-    max_y, max_x = stdscr.getmaxyx()
-
-    # 计算居中偏移
-    offset_y = max(0, (max_y - board_height - 2) // 2)
-    offset_x = max(0, (max_x - board_width) // 2)
-
-    draw_leaderboard(stdscr, npc_scores, state.score, offset_y, color_enabled)
-    draw_lives(stdscr, state.lives, max_x, max_y, offset_y, color_enabled)
-
-    wall_glyph = get_wall_glyph()
-    wall_attr = curses.color_pair(5) if color_enabled else 0
-    text_attr = curses.color_pair(5) if color_enabled else 0
-    for x in range(0, board_width, CELL_WIDTH):
-        _draw_wall_cell(stdscr, offset_y, offset_x + x, wall_glyph, wall_attr)
-        _draw_wall_cell(stdscr, offset_y + board_height - 1, offset_x + x, wall_glyph, wall_attr)
-    for y in range(1, board_height - 1):
-        _draw_wall_cell(stdscr, offset_y + y, offset_x, wall_glyph, wall_attr)
-        _draw_wall_cell(stdscr, offset_y + y, offset_x + board_width - CELL_WIDTH, wall_glyph, wall_attr)
-
-    food_x, food_y = state.food
-    food_attr = (curses.color_pair(3) | curses.A_BOLD) if color_enabled else 0
-    _safe_addstr(stdscr, offset_y + food_y + 1, offset_x + 1 + food_x * CELL_WIDTH, "🍎", food_attr)
-
-    for idx, (x, y) in enumerate(state.snake):
-        ch = "😮" if idx == 0 else "😳"
-        color = (
-            (curses.color_pair(1) | curses.A_BOLD)
-            if idx == 0
-            else curses.color_pair(2)
-        ) if color_enabled else 0
-        _safe_addstr(stdscr, offset_y + y + 1, offset_x + 1 + x * CELL_WIDTH, ch, color)
-
-    _safe_addstr(
-        stdscr,
-        offset_y + board_height,
-        offset_x,
-        f"Score: {state.score}   P:Pause  R:Restart  Q:Quit",
-        text_attr,
-    )
-    if paused and not state.game_over:
-        _safe_addstr(stdscr, offset_y + board_height + 1, offset_x, "Paused", text_attr)
-    if state.game_over:
-        draw_game_over_banner(stdscr, max_y, max_x, color_enabled)
-        _safe_addstr(
-            stdscr,
-            offset_y + board_height + 1,
-            offset_x,
-            "Game Over! Press R to restart or Q to quit.",
-            text_attr,
-        )
-    stdscr.refresh()
-    return max_y >= 2 and max_x >= 2
+        renderer.emit(start_row + idx, x, line, attr)
+
+
+class Renderer:
+    """Diff-based frame renderer.
+
+    ``draw`` composes the frame into ``(y, x) -> (text, attr)`` cells and
+    flushes only the cells that differ from the previous frame, so a
+    steady-state tick writes a handful of cells (head, tail, food) to the
+    terminal instead of re-emitting the whole screen.
+    """
+
+    def __init__(self, palette: Dict[str, int]) -> None:
+        self._palette = palette
+        self._prev: Dict[Tuple[int, int], Tuple[str, int]] = {}
+        self._next: Dict[Tuple[int, int], Tuple[str, int]] = {}
+        self._geometry: Tuple[int, ...] = ()
+        self._full_repaint = True
+        self._coords_key: Tuple[int, ...] = ()
+        self._row_y: Tuple[int, ...] = ()
+        self._col_x: Tuple[int, ...] = ()
+        self._hud_key: Tuple = ()
+        self._hud_cells: Dict[Tuple[int, int], Tuple[str, int]] = {}
+
+    def invalidate(self) -> None:
+        """Force a full repaint on the next ``draw`` call."""
+        self._prev = {}
+        self._full_repaint = True
+
+    def emit(self, y: int, x: int, text: str, attr: int = 0) -> None:
+        self._next[(y, x)] = (text, attr)
+
+    def draw(self, stdscr: curses.window, state: GameState, paused: bool, npc_scores: List[Tuple[str, str, int]], term_size: Tuple[int, int]) -> bool:
+        board_width = state.width * CELL_WIDTH + 2
+        board_height = state.height + 2
+        max_y, max_x = term_size
+
+        # 计算居中偏移
+        offset_y = max(0, (max_y - board_height - 2) // 2)
+        offset_x = max(0, (max_x - board_width) // 2)
+
+        geometry = (max_y, max_x, state.width, state.height, state.game_over)
+        if geometry != self._geometry:
+            self._geometry = geometry
+            self.invalidate()
+
+        # 棋盘格子到屏幕坐标的查找表，仅在偏移或尺寸变化时重建
+        coords_key = (offset_x, offset_y, state.width, state.height)
+        if coords_key != self._coords_key:
+            self._coords_key = coords_key
+            self._row_y = tuple(offset_y + y + 1 for y in range(state.height))
+            self._col_x = tuple(offset_x + 1 + x * CELL_WIDTH for x in range(state.width))
+        row_y, col_x = self._row_y, self._col_x
+
+        palette = self._palette
+        wall_glyph = get_wall_glyph()
+        wall_attr = palette["wall"]
+        text_attr = palette["text"]
+
+        # HUD（排行榜、生命、状态行）只在相关数据变化时重新组装
+        hud_key = (state.score, state.lives, tuple(npc_scores), offset_x, offset_y, max_x, max_y, state.width, state.height)
+        if hud_key != self._hud_key:
+            self._hud_key = hud_key
+            live_cells = self._next
+            self._next = {}
+            draw_leaderboard(self, npc_scores, state.score, offset_y, palette, offset_x)
+            draw_lives(self, state.lives, max_x, max_y, offset_y, palette, offset_x + board_width)
+            self.emit(
+                offset_y + board_height,
+                offset_x,
+                f"Score: {state.score}   P:Pause  R:Restart  Q:Quit",
+                text_attr,
+            )
+            self._hud_cells = self._next
+            self._next = live_cells
+        self._next.update(self._hud_cells)
+
+        top_bottom, side = _wall_rows(board_width, wall_glyph)
+        self.emit(offset_y, offset_x, top_bottom, wall_attr)
+        self.emit(offset_y + board_height - 1, offset_x, top_bottom, wall_attr)
+        for y in range(1, board_height - 1):
+            self.emit(offset_y + y, offset_x, side, wall_attr)
+
+        food_x, food_y = state.food
+        self.emit(row_y[food_y], col_x[food_x], "🍎", palette["food"])
+
+        head_attr = palette["head"]
+        body_attr = palette["body"]
+        for idx, (x, y) in enumerate(zip(state.snake_xs, state.snake_ys)):
+            if idx == 0:
+                self.emit(row_y[y], col_x[x], "😮", head_attr)
+            else:
+                self.emit(row_y[y], col_x[x], "😳", body_attr)
+
+        if paused and not state.game_over:
+            self.emit(offset_y + board_height + 1, offset_x, "Paused", text_attr)
+        if state.game_over:
+            draw_game_over_banner(self, max_y, max_x, palette)
+            self.emit(
+                offset_y + board_height + 1,
+                offset_x,
+                "Game Over! Press R to restart or Q to quit.",
+                text_attr,
+            )
+        self._flush(stdscr)
+        return max_y >= 2 and max_x >= 2
+
+    @staticmethod
+    def _cell_width(text: str) -> int:
+        # 终端列宽估算：ASCII 每字符一列，emoji 之类按两列
+        return len(text) if text.isascii() else 2 * len(text)
+
+    def _flush_full(self, stdscr: curses.window) -> None:
+        # 整屏重绘时把相邻同属性的单元格合并成一次 addstr。
+        # 按组装顺序遍历，后画的内容（如结束横幅）保持盖在先画的上面
+        run_y = run_x = -1
+        run_text = ""
+        run_attr = 0
+        run_end = 0
+        run_open = False
+        for (y, x), (text, attr) in self._next.items():
+            # 列宽可精确估算才允许并入批次（ASCII 或单个宽字符）
+            reliable = text.isascii() or len(text) == 1
+            if run_open and reliable and y == run_y and attr == run_attr and 0 <= x - run_end <= CELL_WIDTH:
+                run_text += " " * (x - run_end) + text
+                run_end = x + self._cell_width(text)
+                continue
+            if run_open:
+                _safe_addstr(stdscr, run_y, run_x, run_text, run_attr)
+            run_y, run_x, run_text, run_attr = y, x, text, attr
+            run_end = x + self._cell_width(text)
+            run_open = reliable
+            if not reliable:
+                _safe_addstr(stdscr, y, x, text, attr)
+        if run_open:
+            _safe_addstr(stdscr, run_y, run_x, run_text, run_attr)
+
+    def _flush(self, stdscr: curses.window) -> None:
+        prev, cells = self._prev, self._next
+        if self._full_repaint:
+            stdscr.erase()
+            self._flush_full(stdscr)
+        else:
+            # 擦除上一帧残留的单元格
+            for key, (text, _attr) in prev.items():
+                if key not in cells:
+                    _safe_addstr(stdscr, key[0], key[1], " " * max(len(text), 2))
+            for key, cell in cells.items():
+                old = prev.get(key)
+                if old == cell:
+                    continue
+                text, attr = cell
+                # 新文本变短时补空格，盖掉旧文本的尾巴
+                if old is not None:
+                    pad = self._cell_width(old[0]) - self._cell_width(text)
+                    if pad > 0:
+                        text = text + " " * pad
+                _safe_addstr(stdscr, key[0], key[1], text, attr)
+        self._prev = cells
+        self._next = {}
+        self._full_repaint = False
+        # 只更新虚拟屏幕；由主循环的 doupdate 统一刷到终端
+        stdscr.noutrefresh()
 
 
 def _run(stdscr: curses.window) -> None:
+    global _RESIZE_PENDING
     try:
         curses.curs_set(0)
     except curses.error:
         pass
 
+    if hasattr(signal, "SIGWINCH"):
+        try:
+            signal.signal(signal.SIGWINCH, _note_resize)
+        except ValueError:  # 非主线程时无法注册
+            pass
+    _RESIZE_PENDING = True
+
     color_enabled = False
     if curses.has_colors():
         try:
@@ -248,26 +466,49 @@ def _run(stdscr: curses.window) -> None:
         except curses.error:
             color_enabled = False
 
-    stdscr.nodelay(True)
+    palette = build_palette(color_enabled)
+
+    # getch 以超时阻塞等待，替代 100Hz 的轮询唤醒
+    stdscr.timeout(100)
+    renderer = Renderer(palette)
     state = create_state_for_terminal(stdscr)
     started = False
     paused = False
     requested_direction = None
     last_tick = time.monotonic()
     
-    # 为每个NPC生成20-30之间的随机分数
-    npc_scores = [(icon, name, random.randint(20, 30)) for icon, name in NPC_PLAYERS]
+    npc_scores = _roll_npc_scores()
+
+    # 只有画面内容变化时才重绘
+    dirty = True
+    can_render = True
+    last_term_size = stdscr.getmaxyx()
 
     while True:
-        target_size = compute_board_size(*stdscr.getmaxyx())
+        if _RESIZE_PENDING:
+            _RESIZE_PENDING = False
+            try:
+                size = os.get_terminal_size()
+                if curses.is_term_resized(size.lines, size.columns):
+                    curses.resizeterm(size.lines, size.columns)
+            except (OSError, curses.error):
+                pass
+            term_size = stdscr.getmaxyx()
+            if term_size != last_term_size:
+                last_term_size = term_size
+                dirty = True
+        target_size = compute_board_size(*last_term_size)
         if target_size != state.width:
             state = create_initial_state(width=target_size, height=target_size)
             paused = False
             requested_direction = None
             last_tick = time.monotonic()
+            dirty = True
 
         if not started:
-            draw_start_screen(stdscr, color_enabled)
+            draw_start_screen(stdscr, palette)
+            _synced_doupdate()
+            stdscr.timeout(100)
             key = stdscr.getch()
             if key in (ord("q"), ord("Q")):
                 break
@@ -277,33 +518,45 @@ def _run(stdscr: curses.window) -> None:
                 paused = False
                 requested_direction = None
                 last_tick = time.monotonic()
-            time.sleep(0.01)
             continue
 
-        can_render = draw(stdscr, state, paused, color_enabled, npc_scores)
+        if dirty:
+            can_render = renderer.draw(stdscr, state, paused, npc_scores, last_term_size)
+            dirty = False
+            _synced_doupdate()
+
+        delay = speed_delay(state.score)
+        if paused or state.game_over or not can_render:
+            stdscr.timeout(250)
+        else:
+            # 阻塞到有按键或下一次逻辑步进为止
+            remaining = last_tick + delay - time.monotonic()
+            stdscr.timeout(max(0, int(remaining * 1000)))
         key = stdscr.getch()
 
         if key in KEYS and not state.game_over:
             requested_direction = KEYS[key]
+        elif key == curses.KEY_RESIZE:
+            _RESIZE_PENDING = True
         elif key in (ord("q"), ord("Q")):
             break
         elif key in (ord("p"), ord("P")) and not state.game_over:
             paused = not paused
+            dirty = True
         elif key in (ord("r"), ord("R")):
             state = create_state_for_terminal(stdscr)
             paused = False
             requested_direction = None
             last_tick = time.monotonic()
-            npc_scores = [(icon, name, random.randint(20, 30)) for icon, name in NPC_PLAYERS]
+            npc_scores = _roll_npc_scores()
+            dirty = True
             continue
 
-        delay = speed_delay(state.score)
         if can_render and not paused and not state.game_over and (time.monotonic() - last_tick) >= delay:
             state = step_state(state, requested_direction)
             requested_direction = None
             last_tick = time.monotonic()
-
-        time.sleep(0.01)
+            dirty = True
 
 
 def run_game() -> None:
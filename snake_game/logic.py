@@ -1,29 +1,53 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from collections import deque
+from dataclasses import dataclass, field, replace
 from random import Random
-from typing import List, Optional, Protocol, Tuple
+from typing import List, Optional, Protocol, Sequence, Tuple
 
 Point = Tuple[int, int]
 Direction = Tuple[int, int]
 
+# 默认随机源；按调用构造 Random() 会重新播种并分配 ~2.5KB 状态
+_DEFAULT_RNG = Random()
+
 
 class SupportsChoice(Protocol):
-    def choice(self, seq: List[Point]) -> Point:
+    def choice(self, seq: Sequence[Point]) -> Point:
         ...
 
 
+def _occupancy(snake: Sequence[Point], width: int) -> int:
+    """Pack the occupied cells into one int, bit ``y * width + x`` per cell."""
+    occ = 0
+    for x, y in snake:
+        occ |= 1 << (y * width + x)
+    return occ
+
+
 @dataclass(frozen=True)
 class GameState:
     width: int
     height: int
-    snake: List[Point]
+    snake: Tuple[Point, ...]
     food: Point
     direction: Direction
     score: int = 0
     game_over: bool = False
     lives: int = 3
     max_lives: int = 3
+    # 占用位图：第 y * width + x 位为 1 表示该格被蛇身占用
+    occ: Optional[int] = None
+    # 蛇身坐标的列式缓存（SoA），绘制循环直接按 int16 数组遍历
+    snake_xs: array = field(init=False, repr=False, compare=False)
+    snake_ys: array = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.occ is None:
+            object.__setattr__(self, "occ", _occupancy(self.snake, self.width))
+        object.__setattr__(self, "snake_xs", array("h", (p[0] for p in self.snake)))
+        object.__setattr__(self, "snake_ys", array("h", (p[1] for p in self.snake)))
 
 
 UP: Direction = (0, -1)
@@ -31,43 +55,91 @@ DOWN: Direction = (0, 1)
 LEFT: Direction = (-1, 0)
 RIGHT: Direction = (1, 0)
 
+_DIRECTIONS: Tuple[Direction, ...] = (RIGHT, LEFT, DOWN, UP)
+
+_GRID_CACHE: dict = {}
+
+
+def _grid_cells(width: int, height: int) -> Tuple[Point, ...]:
+    cached = _GRID_CACHE.get((width, height))
+    if cached is None:
+        cached = tuple((x, y) for y in range(height) for x in range(width))
+        _GRID_CACHE[(width, height)] = cached
+    return cached
+
+
+def _pick_cell(picker: SupportsChoice, width: int, height: int) -> Point:
+    randrange = getattr(picker, "randrange", None)
+    if randrange is not None:
+        return (randrange(width), randrange(height))
+    return picker.choice(_grid_cells(width, height))
 
-def _initial_snake(width: int, height: int) -> List[Point]:
+
+def _initial_snake(width: int, height: int) -> Tuple[Point, ...]:
     center = (width // 2, height // 2)
-    return [center, (center[0] - 1, center[1]), (center[0] - 2, center[1])]
+    return (center, (center[0] - 1, center[1]), (center[0] - 2, center[1]))
+
+
+def _pop_free_cell(
+    available: List[Point], occupied: set, picker: SupportsChoice
+) -> Optional[Point]:
+    """Pop a random unoccupied cell from ``available`` via swap-and-pop.
+
+    Entries that became occupied since the list was built are discarded as
+    they are drawn. Choice-only rngs pick over the still-free entries
+    instead; either way the returned cell leaves ``available``.
+    """
+    randrange = getattr(picker, "randrange", None)
+    if randrange is None:
+        free = [cell for cell in available if cell not in occupied]
+        if not free:
+            return None
+        cell = picker.choice(free)
+        if cell in available:
+            available.remove(cell)
+        return cell
+    while available:
+        idx = randrange(len(available))
+        available[idx], available[-1] = available[-1], available[idx]
+        cell = available.pop()
+        if cell not in occupied:
+            return cell
+    return None
 
 
 def _respawn_snake(width: int, height: int, length: int, rng: Optional[SupportsChoice] = None) -> List[Point]:
-    picker = rng or Random()
+    picker = rng or _DEFAULT_RNG
     # 随机选择起始位置
-    start_x = picker.choice(list(range(width)))
-    start_y = picker.choice(list(range(height)))
-    
-    # 从起始位置生成蛇身
-    snake = [(start_x, start_y)]
-    directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-    
+    snake = [_pick_cell(picker, width, height)]
+    occupied = {snake[0]}
+    available: Optional[List[Point]] = None
+
     for _ in range(min(length - 1, width * height - 1)):
-        # 尝试向任意方向延伸
-        for dx, dy in picker.choice([directions]):
-            next_x = snake[-1][0] + dx
-            next_y = snake[-1][1] + dy
-            if 0 <= next_x < width and 0 <= next_y < height and (next_x, next_y) not in snake:
-                snake.append((next_x, next_y))
-                break
+        tail_x, tail_y = snake[-1]
+        # 随机选择一个可以延伸的相邻格子
+        candidates = [
+            (tail_x + dx, tail_y + dy)
+            for dx, dy in _DIRECTIONS
+            if 0 <= tail_x + dx < width
+            and 0 <= tail_y + dy < height
+            and (tail_x + dx, tail_y + dy) not in occupied
+        ]
+        if candidates:
+            cell = picker.choice(candidates)
         else:
-            # 如果所有方向都不可行，尝试找任意空位
-            occupied = set(snake)
-            available = [(x, y) for x in range(width) for y in range(height) if (x, y) not in occupied]
-            if available:
-                snake.append(picker.choice(available))
-            else:
+            # 如果所有方向都不可行，从剩余空位中取；空位列表整个重生过程只构建一次
+            if available is None:
+                available = [p for p in _grid_cells(width, height) if p not in occupied]
+            cell = _pop_free_cell(available, occupied, picker)
+            if cell is None:
                 break
-    
+        snake.append(cell)
+        occupied.add(cell)
+
     return snake
 
 
-def _direction_from_snake(snake: List[Point]) -> Direction:
+def _direction_from_snake(snake: Sequence[Point]) -> Direction:
     if len(snake) < 2:
         return RIGHT
     return (snake[0][0] - snake[1][0], snake[0][1] - snake[1][1])
@@ -96,44 +168,50 @@ def update_direction(current: Direction, requested: Direction) -> Direction:
 
 
 def spawn_food(
-    snake: List[Point], width: int, height: int, rng: Optional[SupportsChoice] = None
+    snake: Sequence[Point],
+    width: int,
+    height: int,
+    rng: Optional[SupportsChoice] = None,
+    occ: Optional[int] = None,
 ) -> Point:
-    occupied = set(snake)
+    if occ is None:
+        occ = _occupancy(snake, width)
+    cells = width * height
+    occupied_count = occ.bit_count()
+    if occupied_count >= cells:
+        raise ValueError("No space left to spawn food.")
+    picker = rng or _DEFAULT_RNG
+    # 拒绝采样：棋盘较空时平均只需一两次尝试
+    randrange = getattr(picker, "randrange", None)
+    if randrange is not None and occupied_count <= 0.7 * cells:
+        while True:
+            idx = randrange(cells)
+            if not (occ >> idx) & 1:
+                return (idx % width, idx // width)
     available = [
-        (x, y) for y in range(height) for x in range(width) if (x, y) not in occupied
+        point for point in _grid_cells(width, height)
+        if not (occ >> (point[1] * width + point[0])) & 1
     ]
-    if not available:
-        raise ValueError("No space left to spawn food.")
-    picker = rng or Random()
     return picker.choice(available)
 
 
-def _after_collision(state: GameState, rng: Optional[SupportsChoice]) -> GameState:
+def _after_collision(
+    state: GameState, direction: Direction, rng: Optional[SupportsChoice]
+) -> GameState:
     next_lives = state.lives - 1
     if next_lives <= 0:
-        return GameState(
-            width=state.width,
-            height=state.height,
-            snake=state.snake,
-            food=state.food,
-            direction=state.direction,
-            score=state.score,
-            game_over=True,
-            lives=0,
-            max_lives=state.max_lives,
-        )
-    next_snake = _respawn_snake(state.width, state.height, len(state.snake), rng)
+        return replace(state, direction=direction, game_over=True, lives=0)
+    next_snake = tuple(_respawn_snake(state.width, state.height, len(state.snake), rng))
     next_food = spawn_food(next_snake, state.width, state.height, rng)
-    return GameState(
-        width=state.width,
-        height=state.height,
+    return replace(
+        state,
         snake=next_snake,
         food=next_food,
         direction=_direction_from_snake(next_snake),
-        score=state.score,
         game_over=False,
         lives=next_lives,
-        max_lives=state.max_lives,
+        # 蛇身换了，位图必须重算
+        occ=None,
     )
 
 
@@ -158,45 +236,27 @@ def step_state(
         or next_head[1] < 0
         or next_head[1] >= state.height
     ):
-        return _after_collision(
-            GameState(
-                width=state.width,
-                height=state.height,
-                snake=state.snake,
-                food=state.food,
-                direction=direction,
-                score=state.score,
-                game_over=state.game_over,
-                lives=state.lives,
-                max_lives=state.max_lives,
-            ),
-            rng,
-        )
+        return _after_collision(state, direction, rng)
 
     grow = next_head == state.food
-    body_for_collision = state.snake if grow else state.snake[:-1]
-    if next_head in body_for_collision:
-        return _after_collision(
-            GameState(
-                width=state.width,
-                height=state.height,
-                snake=state.snake,
-                food=state.food,
-                direction=direction,
-                score=state.score,
-                game_over=state.game_over,
-                lives=state.lives,
-                max_lives=state.max_lives,
-            ),
-            rng,
-        )
+    body_occ = state.occ
+    if not grow:
+        # 不增长时蛇尾会让出格子，不参与碰撞
+        tail_x, tail_y = state.snake[-1]
+        body_occ &= ~(1 << (tail_y * state.width + tail_x))
+    head_bit = 1 << (next_head[1] * state.width + next_head[0])
+    if body_occ & head_bit:
+        return _after_collision(state, direction, rng)
 
-    next_snake = [next_head] + state.snake
+    body = deque(state.snake)
+    body.appendleft(next_head)
+    next_occ = body_occ | head_bit
     next_score = state.score
     next_food = state.food
 
     if grow:
         next_score += 1
+        next_snake = tuple(body)
         if len(next_snake) == state.width * state.height:
             return GameState(
                 width=state.width,
@@ -208,10 +268,12 @@ def step_state(
                 game_over=True,
                 lives=state.lives,
                 max_lives=state.max_lives,
+                occ=next_occ,
             )
-        next_food = spawn_food(next_snake, state.width, state.height, rng)
+        next_food = spawn_food(next_snake, state.width, state.height, rng, occ=next_occ)
     else:
-        next_snake.pop()
+        body.pop()
+        next_snake = tuple(body)
 
     return GameState(
         width=state.width,
@@ -223,4 +285,5 @@ def step_state(
         game_over=False,
         lives=state.lives,
         max_lives=state.max_lives,
+        occ=next_occ,
     )
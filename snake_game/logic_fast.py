@@ -0,0 +1,199 @@
+"""Allocation-free stepping kernel for headless simulation.
+
+The curses front end keeps using the dataclass-based ``step_state``; this
+module is for tight loops (self-play, benchmarks, soak tests) where the
+per-tick tuple and set allocations of ``step_state`` dominate. The snake
+lives in a preallocated circular buffer of coordinates plus a flat
+occupancy grid, so a tick touches a constant number of array slots.
+
+When numba is installed the kernel is compiled to machine code via
+``@njit``; otherwise the exact same function runs as plain Python on
+``array.array`` buffers.
+"""
+
+from __future__ import annotations
+
+from array import array
+from random import Random
+from typing import Optional, Tuple
+
+from snake_game.logic import (
+    Direction,
+    GameState,
+    Point,
+    _direction_from_snake,
+    _respawn_snake,
+    update_direction,
+)
+
+try:
+    from numba import njit
+    import numpy
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # optional dependency
+    numpy = None
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        if args and callable(args[0]) and not kwargs:
+            return args[0]
+        return wrap
+
+
+MOVED = 0
+ATE = 1
+COLLIDED = 2
+WON = 3
+
+
+@njit(cache=True)
+def _step_kernel(snake_x, snake_y, occ, head, length, width, height, dx, dy, food_x, food_y):
+    """Advance the snake one cell in place.
+
+    Returns ``(head, length, status)``; buffers are only mutated when the
+    move is accepted.
+    """
+    capacity = width * height
+    next_x = snake_x[head] + dx
+    next_y = snake_y[head] + dy
+    if next_x < 0 or next_x >= width or next_y < 0 or next_y >= height:
+        return head, length, 2
+    grow = next_x == food_x and next_y == food_y
+    tail = (head + length - 1) % capacity
+    tail_cell = snake_y[tail] * width + snake_x[tail]
+    if not grow:
+        # 尾巴会让出格子，先移除再查碰撞
+        occ[tail_cell] = 0
+    next_cell = next_y * width + next_x
+    if occ[next_cell]:
+        if not grow:
+            occ[tail_cell] = 1
+        return head, length, 2
+    new_head = (head - 1) % capacity
+    snake_x[new_head] = next_x
+    snake_y[new_head] = next_y
+    occ[next_cell] = 1
+    if grow:
+        length += 1
+        if length == capacity:
+            return new_head, length, 3
+        return new_head, length, 1
+    return new_head, length, 0
+
+
+class FastGame:
+    """Mutable game wrapper around the circular-buffer kernel.
+
+    Mirrors the rules of ``step_state`` (growth, lives, respawn, win on a
+    full board) but mutates preallocated buffers instead of rebuilding a
+    frozen ``GameState`` per tick. Convert back with ``to_state``.
+    """
+
+    def __init__(self, state: GameState, rng: Optional[Random] = None) -> None:
+        self._rng = rng or Random()
+        self.width = state.width
+        self.height = state.height
+        self.food: Point = state.food
+        self.direction: Direction = state.direction
+        self.score = state.score
+        self.game_over = state.game_over
+        self.lives = state.lives
+        self.max_lives = state.max_lives
+        self._load_snake(state.snake)
+
+    def _load_snake(self, snake) -> None:
+        capacity = self.width * self.height
+        if NUMBA_AVAILABLE:
+            self._snake_x = numpy.zeros(capacity, dtype=numpy.int32)
+            self._snake_y = numpy.zeros(capacity, dtype=numpy.int32)
+            self._occ = numpy.zeros(capacity, dtype=numpy.int8)
+        else:
+            self._snake_x = array("i", bytes(4 * capacity))
+            self._snake_y = array("i", bytes(4 * capacity))
+            self._occ = array("b", bytes(capacity))
+        self._head = 0
+        self._length = len(snake)
+        for idx, (x, y) in enumerate(snake):
+            self._snake_x[idx] = x
+            self._snake_y[idx] = y
+            self._occ[y * self.width + x] = 1
+
+    def snake(self) -> Tuple[Point, ...]:
+        capacity = self.width * self.height
+        return tuple(
+            (
+                int(self._snake_x[(self._head + idx) % capacity]),
+                int(self._snake_y[(self._head + idx) % capacity]),
+            )
+            for idx in range(self._length)
+        )
+
+    def to_state(self) -> GameState:
+        return GameState(
+            width=self.width,
+            height=self.height,
+            snake=self.snake(),
+            food=self.food,
+            direction=self.direction,
+            score=self.score,
+            game_over=self.game_over,
+            lives=self.lives,
+            max_lives=self.max_lives,
+        )
+
+    def step(self, requested_direction: Optional[Direction] = None) -> int:
+        if self.game_over:
+            return MOVED
+        if requested_direction is not None:
+            self.direction = update_direction(self.direction, requested_direction)
+        head, length, status = _step_kernel(
+            self._snake_x,
+            self._snake_y,
+            self._occ,
+            self._head,
+            self._length,
+            self.width,
+            self.height,
+            self.direction[0],
+            self.direction[1],
+            self.food[0],
+            self.food[1],
+        )
+        if status == COLLIDED:
+            self.lives -= 1
+            if self.lives <= 0:
+                self.lives = 0
+                self.game_over = True
+                return status
+            snake = _respawn_snake(self.width, self.height, self._length, self._rng)
+            self._load_snake(snake)
+            self.direction = _direction_from_snake(snake)
+            self.food = self._spawn_food()
+            return status
+        self._head, self._length = head, length
+        if status == WON:
+            self.score += 1
+            self.game_over = True
+        elif status == ATE:
+            self.score += 1
+            self.food = self._spawn_food()
+        return status
+
+    def _spawn_food(self) -> Point:
+        # 在占用位图上做拒绝采样，棋盘较满时退回线性枚举
+        capacity = self.width * self.height
+        occ = self._occ
+        if self._length <= 0.7 * capacity:
+            while True:
+                idx = self._rng.randrange(capacity)
+                if not occ[idx]:
+                    return (idx % self.width, idx // self.width)
+        free = [idx for idx in range(capacity) if not occ[idx]]
+        if not free:
+            raise ValueError("No space left to spawn food.")
+        idx = self._rng.choice(free)
+        return (idx % self.width, idx // self.width)
@@ -1,6 +1,92 @@
 import unittest
+from unittest import mock
 
-from snake_game.cli import MAX_BOARD_SIZE, MIN_BOARD_SIZE, compute_board_size
+from snake_game import cli
+from snake_game.cli import (
+    CELL_WIDTH,
+    MAX_BOARD_SIZE,
+    MIN_BOARD_SIZE,
+    Renderer,
+    build_palette,
+    compute_board_size,
+    speed_delay,
+)
+from snake_game.logic import create_initial_state
+
+
+class _FakeWindow:
+    def erase(self):
+        pass
+
+    def noutrefresh(self):
+        pass
+
+
+class TestRendererFlush(unittest.TestCase):
+    def test_shrinking_cell_text_erases_the_old_tail(self):
+        renderer = Renderer(palette={})
+        window = _FakeWindow()
+        with mock.patch.object(cli, "_safe_addstr") as addstr:
+            renderer.emit(3, 0, "Score: 12   P:Pause  R:Restart  Q:Quit")
+            renderer._flush(window)  # 首帧整屏重绘
+            addstr.reset_mock()
+            renderer.emit(3, 0, "Score: 0   P:Pause  R:Restart  Q:Quit")
+            renderer._flush(window)
+        addstr.assert_called_once_with(
+            window, 3, 0, "Score: 0   P:Pause  R:Restart  Q:Quit ", 0
+        )
+
+    def test_full_repaint_keeps_later_emits_on_top(self):
+        renderer = Renderer(palette={})
+        window = _FakeWindow()
+        with mock.patch.object(cli, "_safe_addstr") as addstr:
+            renderer.emit(5, 16, "😳", 2)  # 先画的蛇身格
+            renderer.emit(5, 15, "# GAME OVER #", 1)  # 后画的横幅行，与蛇身重叠
+            renderer._flush(window)
+        calls = [call.args for call in addstr.call_args_list]
+        self.assertEqual(calls[-1], (window, 5, 15, "# GAME OVER #", 1))
+
+
+class TestRendererHudClipping(unittest.TestCase):
+    def _compose_frame(self, term_rows, term_cols):
+        renderer = Renderer(palette=build_palette(False))
+        size = compute_board_size(term_rows, term_cols)
+        state = create_initial_state(width=size, height=size)
+        npc_scores = [("@", "Gemini", 30), ("#", "OpenAI", 25)]
+        with mock.patch.object(cli, "_safe_addstr"):
+            renderer.draw(_FakeWindow(), state, False, npc_scores, (term_rows, term_cols))
+        return renderer._prev, size
+
+    def test_leaderboard_is_skipped_when_it_would_reach_the_wall(self):
+        # 80x24：offset_x=7，排行榜每行约 9 列，放不下就不画
+        cells, size = self._compose_frame(24, 80)
+        offset_x = (80 - (size * CELL_WIDTH + 2)) // 2
+        for (_y, x), (text, _attr) in cells.items():
+            self.assertGreaterEqual(x, offset_x, f"HUD cell {text!r} left of the board wall")
+
+    def test_leaderboard_shows_when_margin_is_wide_enough(self):
+        cells, _size = self._compose_frame(51, 200)
+        texts = [text for text, _attr in cells.values()]
+        self.assertIn("🏆 TOP SCORES", texts)
+
+    def test_hearts_are_skipped_when_they_would_reach_the_wall(self):
+        # 70 列时心形起点（max_x-4=66）落在右墙以内，必须跳过
+        cells, _size = self._compose_frame(24, 70)
+        texts = [text for text, _attr in cells.values()]
+        self.assertNotIn("❤️", texts)
+        wide_cells, _size = self._compose_frame(24, 80)
+        wide_texts = [text for text, _attr in wide_cells.values()]
+        self.assertIn("❤️", wide_texts)
+
+
+class TestSpeedDelay(unittest.TestCase):
+    def test_speed_delay_matches_formula(self):
+        self.assertAlmostEqual(speed_delay(0), 0.16)
+        self.assertAlmostEqual(speed_delay(10), 0.11)
+
+    def test_speed_delay_has_floor(self):
+        self.assertAlmostEqual(speed_delay(31), 0.01)
+        self.assertEqual(speed_delay(1000), 0.01)
 
 
 class TestCliSizing(unittest.TestCase):
@@ -1,9 +1,11 @@
 import unittest
+from random import Random
 
 from snake_game.logic import (
     DOWN,
     RIGHT,
     GameState,
+    _respawn_snake,
     create_initial_state,
     step_state,
     update_direction,
@@ -18,6 +20,17 @@ class FixedChoice:
         return self.value
 
 
+class ScriptedChoice:
+    """Choice-only rng that picks scripted indices from each sequence."""
+
+    def __init__(self, script):
+        self.script = list(script)
+
+    def choice(self, seq):
+        idx = self.script.pop(0) if self.script else 0
+        return seq[idx % len(seq)]
+
+
 class TestSnakeLogic(unittest.TestCase):
     def test_default_board_is_square_20(self):
         state = create_initial_state(rng=FixedChoice((0, 0)))
@@ -60,6 +73,31 @@ class TestSnakeLogic(unittest.TestCase):
         self.assertEqual(next_state.lives, 2)
         self.assertEqual(len(next_state.snake), 5)
 
+    def test_respawned_snake_cells_are_unique_and_in_bounds(self):
+        state = GameState(
+            width=5,
+            height=5,
+            snake=[(4, 2), (3, 2), (2, 2), (1, 2), (0, 2)],
+            food=(0, 0),
+            direction=RIGHT,
+            score=0,
+            game_over=False,
+            lives=3,
+        )
+        next_state = step_state(state, rng=Random(7))
+        self.assertEqual(len(next_state.snake), 5)
+        self.assertEqual(len(set(next_state.snake)), 5)
+        for x, y in next_state.snake:
+            self.assertTrue(0 <= x < 5)
+            self.assertTrue(0 <= y < 5)
+
+    def test_respawn_with_choice_only_rng_never_duplicates_cells(self):
+        # 该脚本会触发多次死胡同回退；回退格子必须从空位中移除
+        script = [1, 1, 0, 0, 3, 3, 3, 1, 2, 2, 3, 3, 1, 3, 3, 2, 3, 0, 3, 2]
+        snake = _respawn_snake(3, 4, 11, ScriptedChoice(script))
+        self.assertEqual(len(snake), 11)
+        self.assertEqual(len(set(snake)), 11)
+
     def test_last_life_collision_does_not_respawn(self):
         state = GameState(
             width=5,
@@ -0,0 +1,70 @@
+import unittest
+from random import Random
+
+from snake_game.logic import DOWN, LEFT, RIGHT, UP, GameState, step_state
+from snake_game.logic_fast import ATE, COLLIDED, FastGame
+
+
+class TestFastGame(unittest.TestCase):
+    def test_movement_matches_step_state(self):
+        state = GameState(
+            width=10,
+            height=10,
+            snake=((5, 5), (4, 5), (3, 5)),
+            food=(0, 0),
+            direction=RIGHT,
+        )
+        game = FastGame(state, rng=Random(1))
+        for direction in (RIGHT, UP, None, LEFT, LEFT, DOWN):
+            state = step_state(state, direction)
+            game.step(direction)
+            self.assertEqual(game.snake(), tuple(state.snake))
+            self.assertEqual(game.direction, state.direction)
+
+    def test_eating_grows_and_scores(self):
+        state = GameState(
+            width=10,
+            height=10,
+            snake=((3, 3), (2, 3), (1, 3)),
+            food=(4, 3),
+            direction=RIGHT,
+        )
+        game = FastGame(state, rng=Random(1))
+        self.assertEqual(game.step(), ATE)
+        self.assertEqual(game.score, 1)
+        self.assertEqual(len(game.snake()), 4)
+        self.assertNotIn(game.food, game.snake())
+
+    def test_wall_collision_on_last_life_ends_game(self):
+        state = GameState(
+            width=5,
+            height=5,
+            snake=((4, 2), (3, 2), (2, 2), (1, 2), (0, 2)),
+            food=(0, 0),
+            direction=RIGHT,
+            lives=1,
+        )
+        game = FastGame(state, rng=Random(1))
+        self.assertEqual(game.step(), COLLIDED)
+        self.assertTrue(game.game_over)
+        self.assertEqual(game.lives, 0)
+
+    def test_wall_collision_respawns_with_remaining_lives(self):
+        state = GameState(
+            width=5,
+            height=5,
+            snake=((4, 2), (3, 2), (2, 2), (1, 2), (0, 2)),
+            food=(0, 0),
+            direction=RIGHT,
+            lives=3,
+        )
+        game = FastGame(state, rng=Random(1))
+        self.assertEqual(game.step(), COLLIDED)
+        self.assertFalse(game.game_over)
+        self.assertEqual(game.lives, 2)
+        self.assertEqual(len(game.snake()), 5)
+        self.assertNotIn(game.food, game.snake())
+
+
+if __name__ == "__main__":
+    unittest.main()